@@ -1,26 +1,36 @@
 #!/usr/bin/env python3
 """CLI for PPTX slide translator."""
 
+import contextlib
 import os
 import sys
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import click
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Pre-styled status markers so worker threads don't re-run click.style per line
+_OK = click.style("✓", fg="green")
+_FAIL = click.style("✗", fg="red")
 
-from src import translator
-from src.docx_handler import DOCXHandler
-from src.pptx_handler import PPTXHandler
+# The translaitor.* modules pull in python-pptx, python-docx and the Gemini SDK,
+# which dominate interpreter start-up; they are imported lazily inside the
+# commands that need them so --help and argument errors stay fast. click
+# itself must be imported eagerly for the command decorators.
 
 
-def get_handler_for_file(file_path):
-    """Get appropriate handler based on file extension.
+@lru_cache(maxsize=None)
+def _handler_for_suffix(suffix):
+    """Get (or create) the shared handler instance for a file suffix.
+
+    Handlers are stateless, so one instance per file type is cached and
+    reused across all files instead of constructing one per call.
 
     Args:
-        file_path: Path to the file
+        suffix: Lowercase file suffix (e.g., '.pptx')
 
     Returns:
         Handler instance (PPTXHandler or DOCXHandler)
@@ -28,11 +38,13 @@ def get_handler_for_file(file_path):
     Raises:
         ValueError: If file type is not supported
     """
-    file_path = str(file_path).lower()
+    if suffix == ".pptx":
+        from translaitor.pptx_handler import PPTXHandler
 
-    if file_path.endswith(".pptx"):
         return PPTXHandler()
-    elif file_path.endswith(".docx"):
+    elif suffix == ".docx":
+        from translaitor.docx_handler import DOCXHandler
+
         return DOCXHandler()
     else:
         raise ValueError(
@@ -40,21 +52,41 @@ def get_handler_for_file(file_path):
         )
 
 
+def get_handler_for_file(file_path):
+    """Get appropriate handler based on file extension.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Handler instance (PPTXHandler or DOCXHandler)
+
+    Raises:
+        ValueError: If file type is not supported
+    """
+    return _handler_for_suffix(Path(file_path).suffix.lower())
+
+
+@lru_cache(maxsize=1)
+def _default_target_lang():
+    """Read the default target language from config.ini, parsing it only once."""
+    try:
+        from translaitor.translator import get_config
+
+        return get_config().get("default", "target_lang")
+    except Exception:
+        return None
+
+
 def get_target_lang(target_lang):
     """Get target language from args or config."""
+    # Explicit --target-lang short-circuits the config read entirely
     if target_lang:
         return target_lang
 
-    # Try to read from config
-    try:
-        from src.translator import get_config
-
-        config = get_config()
-        default_lang = config.get("default", "target_lang")
-        if default_lang:
-            return default_lang
-    except Exception:
-        pass
+    default_lang = _default_target_lang()
+    if default_lang:
+        return default_lang
 
     # If no config default, raise error
     click.secho(
@@ -86,11 +118,12 @@ def cli():
 @cli.command("extract")
 @click.argument("input", type=click.Path(exists=True))
 @click.argument("output", type=click.Path())
-def extract(input, output):
+@click.option("--pretty", is_flag=True, help="Indent the JSON output for readability")
+def extract(input, output, pretty):
     """Extract text from document (PPTX/DOCX) to JSON."""
     try:
         handler = get_handler_for_file(input)
-        handler.extract(input, output)
+        handler.extract(input, output, pretty=pretty)
     except Exception as e:
         click.secho(f"✗ Error: {e}", fg="red", err=True)
         sys.exit(1)
@@ -116,6 +149,8 @@ def extract(input, output):
 def translate_json(input, output, target_lang, source_lang, style, topic):
     """Translate JSON file using Gemini API."""
     try:
+        from translaitor import translator
+
         target_lang = get_target_lang(target_lang)
         translator.translate(input, output, target_lang, source_lang, style=style, topic=topic)
     except Exception as e:
@@ -157,46 +192,161 @@ def reintegrate(original, translated_json, output):
 def translate(input, output, target_lang, source_lang, style, topic):
     """Translate document (PPTX/DOCX) - full pipeline."""
     try:
+        from translaitor import translator
+
         target_lang = get_target_lang(target_lang)
         handler = get_handler_for_file(input)
 
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp_extract:
-            extracted_path = tmp_extract.name
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp_translate:
-            translated_path = tmp_translate.name
-
         click.echo(f"Step 1/3: Extracting text from {input}...")
-        handler.extract(input, extracted_path)
+        # One parse serves both extraction and reintegration
+        document = handler.load_document(input)
+        data = handler.extract_from_document(document)
+        handler.print_extraction_summary(data)
 
         click.echo(f"\nStep 2/3: Translating to {target_lang}...")
-        translator.translate(
-            extracted_path, translated_path, target_lang, source_lang, style=style, topic=topic
+        translated_data = translator.translate_data(
+            data, target_lang, source_lang, style=style, topic=topic
         )
 
         click.echo("\nStep 3/3: Creating translated document...")
-        handler.reintegrate(input, translated_path, output)
-
-        # Cleanup temp files
-        os.unlink(extracted_path)
-        os.unlink(translated_path)
+        # Write to a scratch path and rename into place to avoid leaving a
+        # partial document on failure
+        part_path = output + ".part"
+        try:
+            total_replaced = handler.reintegrate_into_document(document, translated_data)
+            handler.save_document(document, part_path)
+            os.replace(part_path, output)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.unlink(part_path)
+            raise
+        handler.print_reintegration_summary(total_replaced, output)
 
         click.secho(f"\n✓ Translation complete: {output}", fg="green")
 
     except Exception as e:
         click.secho(f"✗ Error: {e}", fg="red", err=True)
-        # Cleanup temp files on error
-        try:
-            if "extracted_path" in locals():
-                os.unlink(extracted_path)
-            if "translated_path" in locals():
-                os.unlink(translated_path)
-        except Exception:
-            pass
         sys.exit(1)
 
 
+def _process_batch(
+    batch,
+    input_path,
+    output_path,
+    target_lang,
+    source_lang,
+    style,
+    topic,
+    skip_set,
+    echo_lock,
+    quiet=False,
+):
+    """Run the extract/translate/reintegrate pipeline for a batch of files.
+
+    All files in the batch are extracted first, translated together with a
+    single Gemini call via translate_many, then reintegrated one by one. A
+    batch of one file degenerates to the plain per-file pipeline.
+
+    Progress lines are buffered and flushed with a single locked echo when
+    the batch finishes, so worker threads don't contend on stdout per line.
+
+    Args:
+        batch: List of document file paths to translate together
+        input_path: Root input directory (for computing relative paths)
+        output_path: Root output directory
+        target_lang: Target language code
+        source_lang: Optional source language code
+        style: Optional translation style override
+        topic: Optional translation topic override
+        skip_set: Precomputed set of existing relative output paths to skip,
+                  or None when existing files should be overwritten
+        echo_lock: Lock serializing click output across worker threads
+        quiet: Suppress per-file progress output entirely
+
+    Returns:
+        list: (status, rel_path, error) tuples where status is "ok", "skip" or "fail"
+    """
+    from translaitor import translator
+
+    results: list[tuple[str, str, Optional[Exception]]] = []
+    pending = []  # (rel_path, output_file, handler, document, data)
+    msgs = []
+
+    def emit(line):
+        if not quiet:
+            msgs.append(line)
+
+    try:
+        # Extract every file in the batch; plain os.path string arithmetic is
+        # noticeably cheaper here than per-file pathlib object construction
+        for doc_file in batch:
+            rel_path = os.path.relpath(doc_file, input_path)
+            output_file = os.path.join(output_path, rel_path)
+
+            # Membership in the precomputed set replaces a per-file stat call
+            if skip_set is not None and rel_path in skip_set:
+                emit(f"Skipping: {rel_path} (already exists)")
+                results.append(("skip", rel_path, None))
+                continue
+
+            # Create subdirectories in output if needed
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+            try:
+                handler = get_handler_for_file(doc_file)
+                # One parse serves both extraction and reintegration
+                document = handler.load_document(doc_file)
+                data = handler.extract_from_document(document)
+                pending.append((rel_path, output_file, handler, document, data))
+            except Exception as e:
+                emit(f"  {_FAIL} Failed: {rel_path}: {e}")
+                results.append(("fail", rel_path, e))
+
+        if not pending:
+            return results
+
+        # Translate the whole batch in one API round trip
+        try:
+            translated_list = translator.translate_many(
+                [data for _, _, _, _, data in pending],
+                target_lang,
+                source_lang,
+                style=style,
+                topic=topic,
+            )
+        except Exception as e:
+            for rel_path, _, _, _, _ in pending:
+                emit(f"  {_FAIL} Failed: {rel_path}: {e}")
+                results.append(("fail", rel_path, e))
+            return results
+
+        # Reintegrate each file from its slice of the batched response
+        for (rel_path, output_file, handler, document, _), translated_data in zip(
+            pending, translated_list
+        ):
+            # Write to a scratch path and rename into place so an interrupted
+            # run never leaves a corrupt document that --skip would then trust
+            part_path = output_file + ".part"
+            try:
+                handler.reintegrate_into_document(document, translated_data)
+                handler.save_document(document, part_path)
+                os.replace(part_path, output_file)
+                emit(f"  {_OK} Success: {rel_path}")
+                results.append(("ok", rel_path, None))
+            except Exception as e:
+                with contextlib.suppress(OSError):
+                    os.unlink(part_path)
+                emit(f"  {_FAIL} Failed: {rel_path}: {e}")
+                results.append(("fail", rel_path, e))
+
+        return results
+
+    finally:
+        if msgs:
+            with echo_lock:
+                click.echo("\n".join(msgs))
+
+
 @cli.command("translate-dir")
 @click.argument("input_dir", type=click.Path(exists=True, file_okay=False, dir_okay=True))
 @click.argument("output_dir", type=click.Path())
@@ -229,6 +379,17 @@ def translate(input, output, target_lang, source_lang, style, topic):
     is_flag=True,
     help="Overwrite existing files in output directory",
 )
+@click.option(
+    "--jobs", default=4, show_default=True, help="Number of files to translate concurrently"
+)
+@click.option(
+    "--batch-size",
+    default=1,
+    show_default=True,
+    help="Number of files to combine into a single Gemini request",
+)
+@click.option("--quiet", is_flag=True, help="Only print the final summary")
+@click.option("--dry-run", is_flag=True, help="List the files that would be translated and exit")
 def translate_dir(
     input_dir,
     output_dir,
@@ -239,6 +400,10 @@ def translate_dir(
     recursive,
     skip_existing,
     overwrite_existing,
+    jobs,
+    batch_size,
+    quiet,
+    dry_run,
 ):
     """Translate all documents (PPTX/DOCX) in a directory.
 
@@ -255,30 +420,75 @@ def translate_dir(
         click.secho("✗ Error: Cannot use both --skip and --overwrite together", fg="red", err=True)
         sys.exit(1)
 
-    input_path = Path(input_dir)
     output_path = Path(output_dir)
 
     # Create output directory if it doesn't exist
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Find all supported document files (PPTX and DOCX)
+    # Find all supported document files (PPTX and DOCX) in one scandir-backed
+    # pass instead of globbing the tree once per extension
+    doc_exts = (".pptx", ".docx")
+    doc_files = []
     if recursive:
-        doc_files = list(input_path.rglob("*.pptx")) + list(input_path.rglob("*.docx"))
+        for dirpath, _dirnames, filenames in os.walk(input_dir):
+            for filename in filenames:
+                if filename.lower().endswith(doc_exts):
+                    doc_files.append(os.path.join(dirpath, filename))
     else:
-        doc_files = list(input_path.glob("*.pptx")) + list(input_path.glob("*.docx"))
+        with os.scandir(input_dir) as entries:
+            doc_files = [
+                entry.path
+                for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(doc_exts)
+            ]
+    doc_files.sort()
 
     if not doc_files:
         click.secho(f"✗ No document files (PPTX/DOCX) found in {input_dir}", fg="yellow")
         return
 
+    # Enumerate existing outputs once unless --overwrite makes them
+    # irrelevant; one scandir-backed walk of the output tree beats a stat
+    # call per input file for large directories
+    existing_outputs = set()
+    if not overwrite_existing and output_path.exists():
+        for dirpath, _dirnames, filenames in os.walk(output_dir):
+            rel_dir = os.path.relpath(dirpath, output_dir)
+            for filename in filenames:
+                existing_outputs.add(os.path.normpath(os.path.join(rel_dir, filename)))
+
+    # Dry run: report what would happen without touching handlers or the API
+    if dry_run:
+        would_translate = 0
+        would_skip = 0
+        would_conflict = 0
+        for doc_file in doc_files:
+            rel_path = os.path.relpath(doc_file, input_dir)
+            if skip_existing and rel_path in existing_outputs:
+                click.echo(f"Would skip: {rel_path} (already exists)")
+                would_skip += 1
+            elif rel_path in existing_outputs:
+                # Without --skip/--overwrite a real run refuses to clobber
+                # these; surface that instead of claiming they'd translate
+                click.echo(f"Would conflict: {rel_path} (already exists)")
+                would_conflict += 1
+            else:
+                click.echo(f"Would translate: {rel_path}")
+                would_translate += 1
+        click.echo(f"\n{would_translate} file(s) would be translated, {would_skip} skipped")
+        if would_conflict:
+            click.echo(
+                f"{would_conflict} existing file(s) would abort the run; pass --skip or --overwrite"
+            )
+        return
+
     # Check for existing files if not overwriting or skipping
     if not skip_existing and not overwrite_existing:
-        existing_files = []
-        for doc_file in doc_files:
-            rel_path = doc_file.relative_to(input_path)
-            output_file = output_path / rel_path
-            if output_file.exists():
-                existing_files.append(str(rel_path))
+        existing_files = [
+            rel_path
+            for rel_path in (os.path.relpath(doc_file, input_dir) for doc_file in doc_files)
+            if rel_path in existing_outputs
+        ]
 
         if existing_files:
             click.secho(
@@ -294,80 +504,53 @@ def translate_dir(
             click.echo("  --overwrite Overwrite existing files")
             sys.exit(1)
 
-    click.echo(f"Found {len(doc_files)} document file(s) to translate")
-    click.echo(f"Target language: {target_lang}")
-    click.echo(f"Output directory: {output_dir}")
-    if skip_existing:
-        click.echo("Mode: Skip existing files")
-    elif overwrite_existing:
-        click.echo(f"\nTranslating {len(doc_files)} files to {target_lang}...\n")
-
+    if not quiet:
+        click.echo(f"Found {len(doc_files)} document file(s) to translate")
+        click.echo(f"Target language: {target_lang}")
+        click.echo(f"Output directory: {output_dir}")
+        if skip_existing:
+            click.echo("Mode: Skip existing files")
+        elif overwrite_existing:
+            click.echo(f"\nTranslating {len(doc_files)} files to {target_lang}...\n")
+
+    # Each file's extract/translate/reintegrate pipeline is independent and
+    # dominated by Gemini API latency, so run them concurrently on a bounded
+    # thread pool and stream results as they complete.
     successful = 0
     skipped = 0
     failed = 0
     failed_files = []
-
-    for doc_file in doc_files:
-        rel_path = doc_file.relative_to(input_path)
-        output_file = output_path / rel_path
-
-        # Check if output file exists and handle based on flags
-        if output_file.exists() and skip_existing:
-            click.echo(f"Skipping: {rel_path} (already exists)")
-            skipped += 1
-            continue
-
-        # Create subdirectories in output if needed
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        click.echo(f"Processing: {rel_path}")
-
-        try:
-            # Get appropriate handler for this file type
-            handler = get_handler_for_file(str(doc_file))
-
-            # Create temporary files
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp_extract:
-                extracted_path = tmp_extract.name
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False
-            ) as tmp_translate:
-                translated_path = tmp_translate.name
-
-            # Extract
-            handler.extract(str(doc_file), extracted_path)
-
-            # Translate
-            translator.translate(
-                extracted_path, translated_path, target_lang, source_lang, style=style, topic=topic
-            )
-
-            # Reintegrate
-            handler.reintegrate(str(doc_file), translated_path, str(output_file))
-
-            # Cleanup temp files
-            os.unlink(extracted_path)
-            os.unlink(translated_path)
-
-            click.secho(f"  ✓ Success: {output_file.name}", fg="green")
-            successful += 1
-
-        except Exception as e:
-            click.secho(f"  ✗ Failed: {e}", fg="red")
-            failed += 1
-            failed_files.append(str(rel_path))
-
-            # Cleanup temp files on error
-            try:
-                if "extracted_path" in locals():
-                    os.unlink(extracted_path)
-                if "translated_path" in locals():
-                    os.unlink(translated_path)
-            except Exception:
-                pass
-
-        click.echo()  # Empty line between files
+    echo_lock = threading.Lock()
+
+    batches = [doc_files[i : i + batch_size] for i in range(0, len(doc_files), batch_size)]
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                _process_batch,
+                batch,
+                input_dir,
+                output_dir,
+                target_lang,
+                source_lang,
+                style,
+                topic,
+                existing_outputs if skip_existing else None,
+                echo_lock,
+                quiet,
+            ): batch
+            for batch in batches
+        }
+
+        for future in as_completed(futures):
+            for status, rel_path, _error in future.result():
+                if status == "ok":
+                    successful += 1
+                elif status == "skip":
+                    skipped += 1
+                else:
+                    failed += 1
+                    failed_files.append(str(rel_path))
 
     # Summary
     if successful > 0:
@@ -1,15 +1,51 @@
 """Base class for document handlers (extraction + reintegration)."""
 
-import json
 from abc import ABC, abstractmethod
 
+from .utils import load_json_file, save_json_file
+
 
 class BaseDocumentHandler(ABC):
     """Base class for handling document extraction and reintegration."""
 
+    # ========== Document Loading ==========
+
+    @abstractmethod
+    def load_document(self, file_path):
+        """Load a document file into its library object.
+
+        Args:
+            file_path: Path to the document file
+
+        Returns:
+            Loaded document object (Presentation or Document)
+        """
+        pass
+
+    @abstractmethod
+    def save_document(self, document, output_path):
+        """Save a loaded document object to a file.
+
+        Args:
+            document: Loaded document object
+            output_path: Path to save the document file
+        """
+        pass
+
     # ========== Extraction Methods ==========
 
     @abstractmethod
+    def extract_from_document(self, document):
+        """Extract text from a loaded document object.
+
+        Args:
+            document: Loaded document object
+
+        Returns:
+            dict: JSON structure with extracted text
+        """
+        pass
+
     def extract_text(self, file_path):
         """Extract text from a document file.
 
@@ -19,27 +55,28 @@ class BaseDocumentHandler(ABC):
         Returns:
             dict: JSON structure with extracted text
         """
-        pass
+        return self.extract_from_document(self.load_document(file_path))
 
-    def save_json(self, data, output_path):
+    def save_json(self, data, output_path, pretty=False):
         """Save extracted data to JSON file.
 
         Args:
             data: Dictionary with extracted data
             output_path: Path to save JSON file
+            pretty: Indent the output for human consumption
         """
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        save_json_file(data, output_path, pretty=pretty)
 
-    def extract(self, input_path, output_path):
+    def extract(self, input_path, output_path, pretty=False):
         """Extract text from document to JSON.
 
         Args:
             input_path: Path to input document file
             output_path: Path to output JSON file
+            pretty: Indent the JSON output for human consumption
         """
         data = self.extract_text(input_path)
-        self.save_json(data, output_path)
+        self.save_json(data, output_path, pretty=pretty)
         self.print_extraction_summary(data)
 
     @abstractmethod
@@ -62,10 +99,21 @@ class BaseDocumentHandler(ABC):
         Returns:
             dict: Translated data
         """
-        with open(json_path, encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(json_path)
 
     @abstractmethod
+    def reintegrate_into_document(self, document, translated_data):
+        """Reintegrate translated text into a loaded document object.
+
+        Args:
+            document: Loaded document object
+            translated_data: Dictionary with translated text
+
+        Returns:
+            int: Number of text elements replaced
+        """
+        pass
+
     def reintegrate_text(self, original_path, translated_data, output_path):
         """Reintegrate translated text into document.
 
@@ -77,7 +125,10 @@ class BaseDocumentHandler(ABC):
         Returns:
             int: Number of text elements replaced
         """
-        pass
+        document = self.load_document(original_path)
+        total_replaced = self.reintegrate_into_document(document, translated_data)
+        self.save_document(document, output_path)
+        return total_replaced
 
     def reintegrate(self, original_path, translated_json_path, output_path):
         """Reintegrate translated JSON back into document.
@@ -0,0 +1,101 @@
+"""Word (DOCX) document handler for extraction and reintegration."""
+
+from typing import Any
+
+from docx import Document
+
+from .base_handler import BaseDocumentHandler
+
+
+def iter_paragraphs(document):
+    """Iterate over all paragraphs of a document in deterministic order.
+
+    Body paragraphs come first, then table cell paragraphs; extraction and
+    reintegration both use this generator so their orders always match.
+
+    Args:
+        document: A Document object from python-docx
+
+    Yields:
+        Paragraph objects
+    """
+    yield from document.paragraphs
+
+    for table in document.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                yield from cell.paragraphs
+
+
+class DOCXHandler(BaseDocumentHandler):
+    """Handler for Word (DOCX) files."""
+
+    def load_document(self, docx_path):
+        """Load a DOCX file.
+
+        Args:
+            docx_path: Path to the DOCX file
+
+        Returns:
+            Document: Loaded document object
+        """
+        return Document(docx_path)
+
+    def save_document(self, document, output_path):
+        """Save a document object to a DOCX file.
+
+        Args:
+            document: Document object
+            output_path: Path to save the DOCX file
+        """
+        document.save(output_path)
+
+    def extract_from_document(self, document):
+        """Extract all text from a loaded document in deterministic order.
+
+        Args:
+            document: Document object from python-docx
+
+        Returns:
+            dict: JSON structure with paragraphs and runs
+        """
+        result: dict[str, list[dict[str, Any]]] = {
+            "paragraphs": [
+                # Extract each non-empty run separately to preserve formatting;
+                # empty paragraphs keep an entry to preserve structure
+                {"texts": [run.text for run in paragraph.runs if run.text]}
+                for paragraph in iter_paragraphs(document)
+            ]
+        }
+
+        return result
+
+    def print_extraction_summary(self, data):
+        """Print extraction summary.
+
+        Args:
+            data: Extracted data dictionary
+        """
+        total_texts = sum(len(para["texts"]) for para in data["paragraphs"])
+        print(f"✓ Extracted {total_texts} text elements from {len(data['paragraphs'])} paragraphs")
+
+    def reintegrate_into_document(self, document, translated_data):
+        """Reintegrate translated text into a loaded document.
+
+        Args:
+            document: Document object from python-docx
+            translated_data: Dictionary with translated text
+
+        Returns:
+            int: Total number of text elements replaced
+        """
+        total_replaced = 0
+
+        # Same traversal as extraction, so paragraphs and translations line up 1:1
+        for paragraph, para_data in zip(iter_paragraphs(document), translated_data["paragraphs"]):
+            runs = [run for run in paragraph.runs if run.text]
+            for run, translated_text in zip(runs, para_data["texts"]):
+                run.text = translated_text
+                total_replaced += 1
+
+        return total_replaced
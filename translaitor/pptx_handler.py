@@ -0,0 +1,153 @@
+"""PowerPoint (PPTX) document handler for extraction and reintegration."""
+
+from typing import Any
+
+from pptx import Presentation
+from pptx.shapes.graphfrm import GraphicFrame
+from pptx.shapes.group import GroupShape
+
+from .base_handler import BaseDocumentHandler
+
+
+def collect_runs_from_shape(root_shape):
+    """Collect text runs from a shape in deterministic order.
+
+    Each run is collected separately to preserve formatting. Grouped shapes
+    are walked with an explicit stack rather than recursion, so deeply
+    nested groups cost neither call frames nor recursion depth.
+
+    Args:
+        root_shape: A shape object from python-pptx
+
+    Returns:
+        list: Run objects with non-empty text
+    """
+    runs = []
+    stack = [root_shape]
+
+    while stack:
+        shape = stack.pop()
+
+        # A shape is exactly one of: text-bearing, a graphic frame (table,
+        # chart, ...) or a group, so one typed check replaces the four
+        # hasattr probes the old walk paid per shape
+        if shape.has_text_frame:
+            # Collect each RUN separately
+            for paragraph in shape.text_frame.paragraphs:
+                for run in paragraph.runs:
+                    if run.text:  # Include runs with any text
+                        runs.append(run)
+
+        elif isinstance(shape, GraphicFrame):
+            # Handle tables - collect each cell's runs
+            if shape.has_table:
+                for row in shape.table.rows:
+                    for cell in row.cells:
+                        for paragraph in cell.text_frame.paragraphs:
+                            for run in paragraph.runs:
+                                if run.text:
+                                    runs.append(run)
+
+        # One C-level XPath probe skips purely decorative groups without
+        # walking their subtree shape by shape
+        elif isinstance(shape, GroupShape) and shape._element.xpath(".//a:t"):
+            # Push children in reverse so they pop in document order
+            stack.extend(reversed(list(shape.shapes)))
+
+    return runs
+
+
+def collect_runs(presentation):
+    """Walk the presentation tree once, collecting run objects per slide.
+
+    Both extraction and reintegration share this traversal, so the
+    shape-dispatch cost is paid a single time and the two directions are
+    guaranteed to see runs in the same order.
+
+    Args:
+        presentation: A Presentation object from python-pptx
+
+    Returns:
+        list: One list of run objects per slide
+    """
+    return [
+        [run for shape in slide.shapes for run in collect_runs_from_shape(shape)]
+        for slide in presentation.slides
+    ]
+
+
+class PPTXHandler(BaseDocumentHandler):
+    """Handler for PowerPoint (PPTX) files."""
+
+    def load_document(self, pptx_path):
+        """Load a PPTX file.
+
+        Args:
+            pptx_path: Path to the PPTX file
+
+        Returns:
+            Presentation: Loaded presentation object
+        """
+        return Presentation(pptx_path)
+
+    def save_document(self, presentation, output_path):
+        """Save a presentation object to a PPTX file.
+
+        Args:
+            presentation: Presentation object
+            output_path: Path to save the PPTX file
+        """
+        presentation.save(output_path)
+
+    def extract_from_document(self, presentation):
+        """Extract all text from a loaded presentation in deterministic order.
+
+        Args:
+            presentation: Presentation object from python-pptx
+
+        Returns:
+            dict: JSON structure with slides and texts
+        """
+        result: dict[str, list[dict[str, Any]]] = {
+            "slides": [
+                {"texts": [run.text for run in slide_runs]}
+                for slide_runs in collect_runs(presentation)
+            ]
+        }
+
+        return result
+
+    def print_extraction_summary(self, data):
+        """Print extraction summary.
+
+        Args:
+            data: Extracted data dictionary
+        """
+        total_texts = sum(len(slide["texts"]) for slide in data["slides"])
+        print(f"✓ Extracted {total_texts} text elements from {len(data['slides'])} slides")
+
+    def reintegrate_into_document(self, presentation, translated_data):
+        """Reintegrate translated text into a loaded presentation.
+
+        Args:
+            presentation: Presentation object from python-pptx
+            translated_data: Dictionary with translated texts
+
+        Returns:
+            int: Total number of text elements replaced
+        """
+        total_replaced = 0
+
+        # Same traversal as extraction, so runs and translations line up 1:1;
+        # slides with nothing to replace skip the shape walk entirely
+        for slide, slide_data in zip(presentation.slides, translated_data["slides"]):
+            texts = slide_data["texts"]
+            if not texts:
+                continue
+
+            slide_runs = [run for shape in slide.shapes for run in collect_runs_from_shape(shape)]
+            for run, translated_text in zip(slide_runs, texts):
+                run.text = translated_text
+                total_replaced += 1
+
+        return total_replaced
@@ -0,0 +1,116 @@
+"""Persistent cache of previous translations."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class TranslationCache:
+    """Disk-backed cache mapping source texts to their translations.
+
+    Entries are keyed by a hash of (text, target_lang, source_lang, style,
+    topic) so recurring boilerplate (template titles, footers, page numbers)
+    is never sent to the Gemini API twice. Stored in a small SQLite database
+    under the user's cache directory.
+    """
+
+    def __init__(self, cache_dir=None, ttl_days=30):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the cache database. Defaults to
+                       ~/.cache/translaitor
+            ttl_days: Days after which cached entries expire
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "translaitor"
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.ttl_seconds = ttl_days * 24 * 3600
+        # The connection is shared across the translate-dir worker threads,
+        # so serialize access with a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_dir / "translations.db"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, translation TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(text, target_lang, source_lang, style, topic):
+        """Build the cache key hash for one text and its translation settings."""
+        raw = "\x1f".join([text, target_lang, source_lang or "", style or "", topic or ""])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, text, target_lang, source_lang=None, style=None, topic=None):
+        """Look up a cached translation.
+
+        Args:
+            text: Source text
+            target_lang: Target language code
+            source_lang: Optional source language code
+            style: Translation style the text was translated with
+            topic: Translation topic the text was translated with
+
+        Returns:
+            str: Cached translation, or None on miss/expiry
+        """
+        key = self._key(text, target_lang, source_lang, style, topic)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translation, ts FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        translation, ts = row
+        if time.time() - ts > self.ttl_seconds:
+            return None
+        return translation
+
+    def put_many(self, pairs, target_lang, source_lang=None, style=None, topic=None):
+        """Store a batch of (source_text, translation) pairs.
+
+        Args:
+            pairs: Iterable of (source_text, translation) tuples
+            target_lang: Target language code
+            source_lang: Optional source language code
+            style: Translation style used
+            topic: Translation topic used
+        """
+        now = time.time()
+        rows = [
+            (self._key(text, target_lang, source_lang, style, topic), translation, now)
+            for text, translation in pairs
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translation, ts) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+
+# Global cache instance
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_translation_cache(cache_dir=None, ttl_days=30):
+    """Get global translation cache instance.
+
+    Args:
+        cache_dir: Directory for the cache database (first call only)
+        ttl_days: Entry time-to-live in days (first call only)
+
+    Returns:
+        TranslationCache: Global cache instance
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TranslationCache(cache_dir=cache_dir, ttl_days=ttl_days)
+        return _cache
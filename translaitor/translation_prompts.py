@@ -3,11 +3,11 @@
 from typing import Union
 
 # Base translation prompt template
-BASE_PROMPT = """Translate the following JSON structure{source_lang_text} to {target_lang}.
+BASE_PROMPT = """Translate the following JSON structure%(source_lang_text)s to %(target_lang)s.
 
-{style_instructions}
+%(style_instructions)s
 
-{topic_instructions}
+%(topic_instructions)s
 
 CRITICAL REQUIREMENTS - FOLLOW EXACTLY:
 1. Preserve the EXACT JSON structure with "slides" array and "texts" arrays
@@ -22,12 +22,12 @@ CRITICAL REQUIREMENTS - FOLLOW EXACTLY:
 10. Preserve line breaks (\\n) within text elements
 
 VALIDATION:
-- Input has {slide_count} slides
+- Input has %(slide_count)s slides
 - Each slide has a specific number of texts - preserve this EXACTLY
 - If input texts array has N elements, output texts array MUST have N elements
 
 Input JSON:
-{json_data}
+%(json_data)s
 
 Return the translated JSON (ONLY the JSON, nothing else):"""
 
@@ -49,6 +49,7 @@ def get_translation_prompt(
     topic="general",
     retry_attempt=0,
     config=None,
+    slide_count=None,
 ):
     """Generate a translation prompt based on configuration.
 
@@ -60,19 +61,23 @@ def get_translation_prompt(
         topic: Topic context (diving, medical, technical, business, education, general)
         retry_attempt: Retry attempt number (adds stronger warnings if >0)
         config: Optional Config object to read instructions from INI file
+        slide_count: Number of slides, if the caller already knows it;
+            avoids re-parsing json_data just to count
 
     Returns:
         str: Complete prompt for translation
     """
-    import json as json_module
-
-    # Parse JSON to count slides for validation
-    slide_count: Union[int, str]
-    try:
-        data = json_module.loads(json_data)
-        slide_count = len(data.get("slides", []))
-    except (json_module.JSONDecodeError, KeyError, TypeError):
-        slide_count = "unknown"
+    if slide_count is None:
+        import json as json_module
+
+        # Parse JSON to count slides for validation
+        count: Union[int, str]
+        try:
+            data = json_module.loads(json_data)
+            count = len(data.get("slides", []))
+        except (json_module.JSONDecodeError, KeyError, TypeError):
+            count = "unknown"
+        slide_count = count
 
     # Format source language text
     source_lang_text = f" from {source_lang}" if source_lang else ""
@@ -91,10 +96,37 @@ def get_translation_prompt(
     if not topic_instructions:
         topic_instructions = DEFAULT_TOPIC_INSTRUCTION
 
-    # Add extra emphasis on retries
-    retry_warning = ""
+    # Build complete prompt; %-interpolation skips the format-spec parse
+    # that str.format pays on every call
+    prompt = BASE_PROMPT % {
+        "source_lang_text": source_lang_text,
+        "target_lang": target_lang,
+        "style_instructions": style_instructions,
+        "topic_instructions": topic_instructions,
+        "slide_count": slide_count,
+        "json_data": json_data,
+    }
+
+    # Append retry warning if needed
     if retry_attempt > 0:
-        retry_warning = f"""
+        prompt += get_retry_warning(retry_attempt)
+
+    return prompt
+
+
+def get_retry_warning(retry_attempt):
+    """Return the extra-emphasis suffix appended to retry prompts.
+
+    Kept separate from the prompt body so retries can reuse an
+    already-built base prompt and only pay for this short suffix.
+
+    Args:
+        retry_attempt: Retry attempt number (must be > 0)
+
+    Returns:
+        str: Warning text to append to the base prompt
+    """
+    return f"""
 
 ⚠️  CRITICAL - RETRY ATTEMPT {retry_attempt}:
 The previous translation had errors (structure mismatch or invalid JSON).
@@ -112,19 +144,3 @@ STRUCTURE REQUIREMENTS:
 - DO NOT COMBINE ADJACENT TEXT ELEMENTS EVEN IF THEY SEEM RELATED
 - TRANSLATE EACH TEXT ELEMENT SEPARATELY AND INDEPENDENTLY
 - Count the input texts carefully and ensure output has the EXACT same count"""
-
-    # Build complete prompt
-    prompt = BASE_PROMPT.format(
-        source_lang_text=source_lang_text,
-        target_lang=target_lang,
-        style_instructions=style_instructions,
-        topic_instructions=topic_instructions,
-        slide_count=slide_count,
-        json_data=json_data,
-    )
-
-    # Append retry warning if needed
-    if retry_warning:
-        prompt += retry_warning
-
-    return prompt
@@ -0,0 +1,934 @@
+"""Translate extracted text using Google Gemini API."""
+
+import configparser
+import contextlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+
+from .translation_cache import get_translation_cache
+from .translation_prompts import get_retry_warning, get_translation_prompt
+from .utils import dumps_json, load_json_file, save_json_file
+
+_SECTION_RE = re.compile(r"^\[([^\]]+)\]\s*$")
+_OPTION_RE = re.compile(r"^([^=:\s][^=:]*?)\s*[:=]\s*(.*)$")
+
+# Matches a response wrapped in a markdown code fence (``` or ```json),
+# capturing just the body
+_FENCE_RE = re.compile(r"^\s*```[^\n]*\n(.*)\n```\s*$", re.DOTALL)
+
+# Constrains Gemini to emit raw JSON, cutting off the freeform-text and
+# markdown-fence failure modes that feed the retry path
+_JSON_GENERATION_CONFIG = {"response_mime_type": "application/json"}
+
+
+class FastConfigParser:
+    """Minimal regex-based replacement for configparser.ConfigParser.
+
+    Parses the INI dialect this project uses — sections, ``key = value``
+    pairs, full-line ``#``/``;`` comments and indented continuation lines —
+    into plain dicts in a single pass, skipping configparser's interpolation
+    and per-line state machinery. Raises the same NoSectionError/
+    NoOptionError so callers need no changes.
+    """
+
+    BOOLEAN_STATES = {
+        "1": True,
+        "yes": True,
+        "true": True,
+        "on": True,
+        "0": False,
+        "no": False,
+        "false": False,
+        "off": False,
+    }
+
+    def __init__(self):
+        self._sections = {}
+
+    def read(self, config_path):
+        """Parse an INI file into the internal section dicts.
+
+        Args:
+            config_path: Path to the INI file
+        """
+        current = None
+        last_key = None
+        with open(config_path, encoding="utf-8") as f:
+            for raw_line in f:
+                line = raw_line.rstrip("\n")
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                if line[0] in " \t":
+                    # Indented line continues the previous value
+                    if current is not None and last_key is not None:
+                        current[last_key] += "\n" + stripped
+                    continue
+                if stripped[0] in "#;":
+                    continue
+                match = _SECTION_RE.match(line)
+                if match:
+                    current = self._sections.setdefault(match.group(1), {})
+                    last_key = None
+                    continue
+                match = _OPTION_RE.match(line)
+                if match and current is not None:
+                    # configparser lowercases option names; keep that
+                    last_key = match.group(1).lower()
+                    current[last_key] = match.group(2).strip()
+
+    def sections(self):
+        """Return the list of section names."""
+        return list(self._sections)
+
+    def get(self, section, option):
+        """Return the raw string value for option in section."""
+        try:
+            values = self._sections[section]
+        except KeyError:
+            raise configparser.NoSectionError(section) from None
+        try:
+            return values[option.lower()]
+        except KeyError:
+            raise configparser.NoOptionError(option, section) from None
+
+    def getint(self, section, option):
+        """Return the value for option in section as an int."""
+        return int(self.get(section, option))
+
+    def getboolean(self, section, option):
+        """Return the value for option in section as a bool."""
+        value = self.get(section, option).lower()
+        if value not in self.BOOLEAN_STATES:
+            raise ValueError(f"Not a boolean: {value}")
+        return self.BOOLEAN_STATES[value]
+
+
+# Parsed config files keyed on (path, mtime_ns, size): an unchanged file is
+# reused by later Config() instances in the same process, an edited one
+# re-parses automatically
+_parsed_configs: Dict[Tuple[str, int, int], Dict[str, Dict[str, str]]] = {}
+
+# config.ini locations keyed by working directory, so repeated Config()
+# constructions skip re-walking the parent chain
+_config_file_locations: Dict[str, Optional[Path]] = {}
+
+
+class Config:
+    """Configuration manager for reading .ini files."""
+
+    def __init__(self, config_path=None):
+        """Initialize configuration.
+
+        Args:
+            config_path: Path to config.ini file. If None, searches for config.ini
+                        in current directory and parent directories.
+        """
+        self.config = FastConfigParser()
+        # Every prompt build and retry re-asks for the same handful of
+        # values; memoize resolved lookups per instance
+        self._value_cache = {}
+
+        config_path = self._find_config_file() if config_path is None else Path(config_path)
+
+        if config_path and config_path.exists():
+            stat = os.stat(config_path)
+            cache_key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+            sections = _parsed_configs.get(cache_key)
+            if sections is None:
+                self.config.read(config_path)
+                _parsed_configs[cache_key] = self.config._sections
+            else:
+                self.config._sections = sections
+
+    def _find_config_file(self):
+        """Search for config.ini in current and parent directories.
+
+        Walks upward with os.path string operations (one stat per level, no
+        Path object churn) and memoizes the result per working directory.
+
+        Returns:
+            Path to config.ini or None if not found
+        """
+        cwd = os.getcwd()
+        if cwd in _config_file_locations:
+            return _config_file_locations[cwd]
+
+        found = None
+        current = cwd
+        while True:
+            candidate = os.path.join(current, "config.ini")
+            if os.path.isfile(candidate):
+                found = Path(candidate)
+                break
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
+
+        _config_file_locations[cwd] = found
+        return found
+
+    def get(self, section, key, default=None, value_type=str):
+        """Get configuration value.
+
+        Args:
+            section: Section name in .ini file
+            key: Key name in section
+            default: Default value if not found
+            value_type: Type to convert value to (str, int, bool)
+
+        Returns:
+            Configuration value or default
+        """
+        cache_key = (section, key, default, value_type)
+        if cache_key in self._value_cache:
+            return self._value_cache[cache_key]
+
+        try:
+            if value_type is bool:
+                value = self.config.getboolean(section, key)
+            elif value_type is int:
+                value = self.config.getint(section, key)
+            else:
+                value = self.config.get(section, key)
+        except (configparser.NoSectionError, configparser.NoOptionError, ValueError):
+            value = default
+
+        self._value_cache[cache_key] = value
+        return value
+
+    def get_gemini_api_key(self):
+        """Get Gemini API key.
+
+        Returns:
+            str: API key
+
+        Raises:
+            ValueError: If API key is not configured
+        """
+        api_key = self.get("gemini", "api_key")
+        if not api_key or api_key == "your_api_key_here":
+            raise ValueError(
+                "GEMINI API key not found or not set. "
+                "Please copy config.ini.example to config.ini and add your API key."
+            )
+        return api_key
+
+    def get_gemini_model(self):
+        """Get Gemini model name."""
+        return self.get("gemini", "model", default="gemini-2.5-flash")
+
+    def get_gemini_concurrency(self):
+        """Get maximum number of concurrent Gemini requests."""
+        return self.get("gemini", "concurrency", default=4, value_type=int)
+
+    def get_gemini_chunk_size(self):
+        """Get number of texts per Gemini request when sharding large payloads."""
+        return self.get("gemini", "chunk_size", default=100, value_type=int)
+
+    def get_gemini_rpm(self):
+        """Get requests-per-minute budget for Gemini calls (0 = unpaced)."""
+        return self.get("gemini", "rpm", default=0, value_type=int)
+
+    def get_translation_style(self):
+        """Get translation style."""
+        return self.get("default", "style", default="direct")
+
+    def get_translation_topic(self):
+        """Get translation topic."""
+        return self.get("default", "topic", default="general")
+
+    def get_max_retries(self):
+        """Get maximum retry attempts."""
+        return self.get("retry", "max_retries", default=5, value_type=int)
+
+    def get_initial_delay(self):
+        """Get initial retry delay in seconds."""
+        return self.get("retry", "initial_delay", default=1, value_type=int)
+
+    def get_cache_enabled(self):
+        """Whether the persistent translation cache is enabled."""
+        return self.get("cache", "enabled", default=True, value_type=bool)
+
+    def get_cache_dir(self):
+        """Get translation cache directory (None = default location)."""
+        return self.get("cache", "dir")
+
+    def get_cache_ttl_days(self):
+        """Get translation cache entry lifetime in days."""
+        return self.get("cache", "ttl_days", default=30, value_type=int)
+
+    def get_style_instructions(self, style):
+        """Get style-specific instructions from config.
+
+        Args:
+            style: Style name (e.g., 'direct', 'formal')
+
+        Returns:
+            str: Style instructions or None if not found in config
+        """
+        return self.get(f"style:{style}", "instructions")
+
+    def get_topic_instructions(self, topic):
+        """Get topic-specific instructions from config.
+
+        Args:
+            topic: Topic name (e.g., 'diving', 'medical')
+
+        Returns:
+            str: Topic instructions or None if not found in config
+        """
+        return self.get(f"topic:{topic}", "instructions")
+
+    def list_styles(self):
+        """List all available styles defined in config.
+
+        Returns:
+            list: List of style names
+        """
+        styles = []
+        for section in self.config.sections():
+            if section.startswith("style:"):
+                style_name = section.split(":", 1)[1]
+                styles.append(style_name)
+        return styles
+
+    def list_topics(self):
+        """List all available topics defined in config.
+
+        Returns:
+            list: List of topic names
+        """
+        topics = []
+        for section in self.config.sections():
+            if section.startswith("topic:"):
+                topic_name = section.split(":", 1)[1]
+                topics.append(topic_name)
+        return topics
+
+
+# Global config instance
+_config = None
+
+
+def get_config():
+    """Get global config instance.
+
+    Returns:
+        Config: Global configuration instance
+    """
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
+
+
+def load_json(json_path):
+    """Load JSON file.
+
+    Args:
+        json_path: Path to JSON file
+
+    Returns:
+        dict: Loaded JSON data
+    """
+    return load_json_file(json_path)
+
+
+def save_json(data, json_path):
+    """Save JSON file.
+
+    Args:
+        data: Dictionary to save
+        json_path: Path to save JSON file
+    """
+    save_json_file(data, json_path)
+
+
+# Configured model handles keyed on (api_key, model_name) so retries and
+# repeated calls reuse the same SDK client instead of rebuilding it
+_model_cache: Dict[Tuple[str, str], genai.GenerativeModel] = {}
+
+
+def configure_gemini():
+    """Configure Gemini API with API key from config.ini."""
+    config = get_config()
+    api_key = config.get_gemini_api_key()
+    model_name = config.get_gemini_model()
+
+    cache_key = (api_key, model_name)
+    model = _model_cache.get(cache_key)
+    if model is None:
+        genai.configure(api_key=api_key)
+        model = genai.GenerativeModel(model_name)
+        _model_cache[cache_key] = model
+    return model
+
+
+class _TokenBucket:
+    """Thread-safe pacer spacing requests to a requests-per-minute budget.
+
+    Concurrent workers that burst past the API quota all land in the
+    exponential-backoff path, which costs far more wall time than pacing
+    the requests in the first place.
+    """
+
+    def __init__(self, rpm):
+        self.rpm = rpm
+        self._interval = 60.0 / rpm
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+_rate_limiter: Optional[_TokenBucket] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def _acquire_request_slot():
+    """Pace an outgoing request against the [gemini] rpm budget, if set."""
+    rpm = get_config().get_gemini_rpm()
+    if rpm <= 0:
+        return
+
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None or _rate_limiter.rpm != rpm:
+            _rate_limiter = _TokenBucket(rpm)
+        limiter = _rate_limiter
+    limiter.acquire()
+
+
+# Shared cool-off after repeated server errors: once several attempts in a
+# row have failed with 5xx, concurrent workers back off together instead of
+# each hammering an unhealthy API through its own retry budget
+_breaker_lock = threading.Lock()
+_breaker = {"failures": 0, "open_until": 0.0}
+
+
+def _breaker_wait():
+    """Sleep out any shared cool-off before issuing a request."""
+    with _breaker_lock:
+        wait = _breaker["open_until"] - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _breaker_record(success, cool_off=0.0):
+    """Track consecutive server errors; open the cool-off after three."""
+    with _breaker_lock:
+        if success:
+            _breaker["failures"] = 0
+        else:
+            _breaker["failures"] += 1
+            if _breaker["failures"] >= 3:
+                _breaker["open_until"] = time.monotonic() + cool_off
+
+
+def _retry_after_seconds(exc):
+    """Extract a usable Retry-After header value from an API exception.
+
+    Args:
+        exc: Exception raised by the Gemini API
+
+    Returns:
+        int seconds to wait, or None if the header is absent or invalid
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    retry_after = headers.get("Retry-After") if headers else None
+    if retry_after is not None:
+        with contextlib.suppress(ValueError, TypeError):
+            return int(retry_after)
+    return None
+
+
+def call_gemini_with_retry(model, prompt, max_retries=5, initial_delay=1):
+    """Call Gemini API with intelligent retry logic.
+
+    Respects Retry-After headers from the API and uses exponential backoff as fallback.
+
+    Args:
+        model: Gemini model instance
+        prompt: Prompt to send to the API
+        max_retries: Maximum number of retry attempts (default: 5)
+        initial_delay: Initial delay in seconds for fallback (default: 1)
+
+    Returns:
+        Response from Gemini API
+
+    Raises:
+        Exception: If all retries are exhausted
+    """
+    for attempt in range(max_retries):
+        try:
+            _breaker_wait()
+            _acquire_request_slot()
+            response = model.generate_content(prompt, generation_config=_JSON_GENERATION_CONFIG)
+            _breaker_record(True)
+            return response
+
+        except google_exceptions.ResourceExhausted as e:
+            # Rate limiting (429) - check for Retry-After header, falling
+            # back to jittered exponential backoff so concurrent workers
+            # don't all re-hit the API at the same instant
+            if attempt < max_retries - 1:
+                wait_time = _retry_after_seconds(e)
+                if wait_time is None:
+                    wait_time = random.uniform(0, initial_delay * (2**attempt))
+
+                print(
+                    f"⚠ Rate limited by Gemini API. "
+                    f"Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(wait_time)
+            else:
+                print(f"✗ Rate limit exceeded after {max_retries} attempts")
+                raise
+
+        except (google_exceptions.ServiceUnavailable, google_exceptions.InternalServerError) as e:
+            # Transient server errors - same Retry-After/jitter treatment,
+            # plus the shared breaker so sustained 5xx pauses all workers
+            if attempt < max_retries - 1:
+                wait_time = _retry_after_seconds(e)
+                if wait_time is None:
+                    wait_time = random.uniform(0, initial_delay * (2**attempt))
+                _breaker_record(False, cool_off=wait_time)
+
+                print(
+                    f"⚠ Gemini API service error. "
+                    f"Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(wait_time)
+            else:
+                _breaker_record(False, cool_off=initial_delay * (2**attempt))
+                print(f"✗ Service error persisted after {max_retries} attempts")
+                raise
+
+        except google_exceptions.DeadlineExceeded:
+            # Timeout - retry with longer (jittered) delay
+            if attempt < max_retries - 1:
+                wait_time = random.uniform(0, initial_delay * (2 ** (attempt + 1)))
+                print(
+                    f"⚠ Request timeout. "
+                    f"Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(wait_time)
+            else:
+                print(f"✗ Timeout persisted after {max_retries} attempts")
+                raise
+
+        except Exception as e:
+            # Other errors - don't retry
+            print(f"✗ Gemini API error: {e}")
+            raise
+
+    raise Exception(f"Failed after {max_retries} retry attempts")
+
+
+def translate_with_gemini(
+    data,
+    target_lang,
+    source_lang=None,
+    retry_attempt=0,
+    style=None,
+    topic=None,
+    json_data=None,
+    base_prompt=None,
+):
+    """Translate JSON data using Gemini API with configurable prompts.
+
+    Args:
+        data: Dictionary with extracted texts
+        target_lang: Target language code (e.g., 'es', 'fr', 'de')
+        source_lang: Optional source language code
+        retry_attempt: Current retry attempt for structure mismatch (internal use)
+        style: Optional translation style override
+        topic: Optional translation topic override
+        json_data: Serialized form of data, if the caller already has it
+            (internal use - JSON retries resend the identical payload)
+        base_prompt: Already-built prompt body, if the caller has it
+            (internal use - retries only append the warning suffix)
+
+    Returns:
+        dict: Translated data in same JSON structure
+    """
+    config = get_config()
+    model = configure_gemini()
+
+    # Get translation style and topic - CLI args override config
+    if style is None:
+        style = config.get_translation_style()
+    if topic is None:
+        topic = config.get_translation_topic()
+
+    # Generate prompt using configurable template; we already hold the
+    # parsed dict, so count items here instead of re-parsing the JSON string.
+    # data is unchanged across JSON retries, so serialize it at most once -
+    # compactly, since indentation only inflates the token count
+    if json_data is None:
+        json_data = dumps_json(data)
+    if base_prompt is None:
+        slide_count = len(data.get("slides") or data.get("paragraphs") or [])
+        base_prompt = get_translation_prompt(
+            json_data=json_data,
+            target_lang=target_lang,
+            source_lang=source_lang,
+            style=style,
+            topic=topic,
+            config=config,
+            slide_count=slide_count,
+        )
+    # Retries reuse the base prompt and pay only for the short suffix
+    prompt = base_prompt + get_retry_warning(retry_attempt) if retry_attempt else base_prompt
+
+    # Get retry settings from config
+    max_retries = config.get_max_retries()
+    initial_delay = config.get_initial_delay()
+
+    # Call Gemini API with retry logic
+    response = call_gemini_with_retry(model, prompt, max_retries, initial_delay)
+
+    # Parse response; one regex match strips a markdown code fence without
+    # the split/join copy pair over the whole response
+    response_text = response.text
+    match = _FENCE_RE.match(response_text)
+    response_text = match.group(1) if match else response_text.strip()
+
+    try:
+        translated_data = json.loads(response_text)
+    except json.JSONDecodeError as e:
+        # Show more context around the error
+        error_start = max(0, e.pos - 100)
+        error_end = min(len(response_text), e.pos + 100)
+        error_context = response_text[error_start:error_end]
+
+        print(f"\n✗ JSON parsing error at position {e.pos}:")
+        print(f"  {e.msg}")
+        print("\nContext around error:")
+        print(f"  ...{error_context}...")
+        print(f"\nFull response length: {len(response_text)} characters")
+
+        # Retry once with a stricter prompt if this is the first attempt
+        if retry_attempt == 0:
+            print("\n⚠ Retrying with stricter JSON formatting prompt...")
+            time.sleep(2)
+            # Same payload, stricter prompt - reuse the serialized form
+            # and the already-built prompt body
+            return translate_with_gemini(
+                data,
+                target_lang,
+                source_lang,
+                retry_attempt + 1,
+                style=style,
+                topic=topic,
+                json_data=json_data,
+                base_prompt=base_prompt,
+            )
+
+        raise ValueError(
+            f"Failed to parse Gemini response as JSON after {retry_attempt + 1} attempts: {e}\n"
+            f"Error at line {e.lineno}, column {e.colno}\n"
+            f"Context: ...{error_context}..."
+        ) from e
+
+    # Validate structure - support both PPTX (slides) and DOCX (paragraphs)
+    structure_key = "slides" if "slides" in data else "paragraphs"
+    item_name = "slide" if structure_key == "slides" else "paragraph"
+
+    if len(data[structure_key]) != len(translated_data[structure_key]):
+        raise ValueError(
+            f"{item_name.capitalize()} count mismatch: original has {len(data[structure_key])} {structure_key}, "
+            f"translated has {len(translated_data[structure_key])} {structure_key}"
+        )
+
+    # Compare per-item text counts as two C-built lists; the common
+    # all-match case is a single list equality instead of a Python loop
+    get_texts = itemgetter("texts")
+    orig_lens = list(map(len, map(get_texts, data[structure_key])))
+    trans_lens = list(map(len, map(get_texts, translated_data[structure_key])))
+
+    if orig_lens != trans_lens:
+        bad_indices = [i for i, (o, t) in enumerate(zip(orig_lens, trans_lens)) if o != t]
+        for i in bad_indices:
+            orig_slide = data[structure_key][i]
+            trans_slide = translated_data[structure_key][i]
+            orig_count = len(orig_slide["texts"])
+            trans_count = len(trans_slide["texts"])
+
+            # Structure mismatch detected - show error
+            print(f"\n✗ Structure mismatch in {item_name} {i + 1}:")
+            print(f"  Original texts ({orig_count}):")
+            for idx, text in enumerate(orig_slide["texts"][:5]):  # Show first 5
+                preview = text[:50] + "..." if len(text) > 50 else text
+                print(f"    [{idx}] {repr(preview)}")
+            if orig_count > 5:
+                print(f"    ... and {orig_count - 5} more")
+
+            print(f"  Translated texts ({trans_count}):")
+            for idx, text in enumerate(trans_slide["texts"][:5]):  # Show first 5
+                preview = text[:50] + "..." if len(text) > 50 else text
+                print(f"    [{idx}] {repr(preview)}")
+            if trans_count > 5:
+                print(f"    ... and {trans_count - 5} more")
+
+        # Retry with more aggressive prompt if under the retry budget,
+        # resending only the mismatched items - the correct ones are kept
+        max_structure_retries = 2
+        if retry_attempt < max_structure_retries:
+            print(
+                f"\n⚠ Retrying {len(bad_indices)} mismatched {item_name}(s) with stricter "
+                f"prompt (attempt {retry_attempt + 1}/{max_structure_retries})..."
+            )
+            time.sleep(2)  # Brief delay before retry
+            sub_data = {structure_key: [data[structure_key][i] for i in bad_indices]}
+            sub_translated = translate_with_gemini(
+                sub_data, target_lang, source_lang, retry_attempt + 1, style=style, topic=topic
+            )
+            for i, item in zip(bad_indices, sub_translated[structure_key]):
+                translated_data[structure_key][i] = item
+            return translated_data
+
+        first_bad = bad_indices[0]
+        raise ValueError(
+            f"Text count mismatch in {item_name} {first_bad + 1} after {max_structure_retries} attempts: "
+            f"original has {len(data[structure_key][first_bad]['texts'])} texts, "
+            f"translated has {len(translated_data[structure_key][first_bad]['texts'])} texts. "
+            f"Gemini API is merging/splitting text elements. "
+            f"Try using 'gemini-2.5-pro' model for better structure preservation."
+        )
+
+    return translated_data
+
+
+def translate_data(data, target_lang, source_lang=None, style=None, topic=None):
+    """Translate extracted data in memory.
+
+    Args:
+        data: Dictionary with extracted texts
+        target_lang: Target language code
+        source_lang: Optional source language code
+        style: Optional translation style override
+        topic: Optional translation topic override
+
+    Returns:
+        dict: Translated data in same JSON structure
+    """
+    # Support both PPTX (slides) and DOCX (paragraphs)
+    structure_key = "slides" if "slides" in data else "paragraphs"
+    total_texts = sum(map(len, map(itemgetter("texts"), data[structure_key])))
+    print(f"Translating {total_texts} text elements to {target_lang}...")
+
+    return _translate_structure(data, target_lang, source_lang, style=style, topic=topic)
+
+
+def _translate_structure(data, target_lang, source_lang=None, style=None, topic=None):
+    """Translate a document structure, reusing cached translations.
+
+    Texts already in the persistent cache (recurring template titles,
+    footers, boilerplate) are filled in locally; only the misses are sent to
+    Gemini as a reduced payload, and their translations are stored for
+    future runs.
+
+    Args:
+        data: Dictionary with extracted texts
+        target_lang: Target language code
+        source_lang: Optional source language code
+        style: Optional translation style override
+        topic: Optional translation topic override
+
+    Returns:
+        dict: Translated data in same JSON structure
+    """
+    config = get_config()
+
+    # Resolve style/topic here so cache keys match what the prompt will use
+    if style is None:
+        style = config.get_translation_style()
+    if topic is None:
+        topic = config.get_translation_topic()
+
+    # Disabling the cache only skips the get/put round trips; dedup and
+    # sharding below still apply
+    if config.get_cache_enabled():
+        cache = get_translation_cache(config.get_cache_dir(), config.get_cache_ttl_days())
+    else:
+        cache = None
+
+    structure_key = "slides" if "slides" in data else "paragraphs"
+    flat_texts = [text for item in data[structure_key] for text in item["texts"]]
+
+    translations = {}
+    misses = []
+    for text in flat_texts:
+        # Empty strings always map to themselves
+        cached = "" if text == "" else None
+        if cached is None and cache is not None:
+            cached = cache.get(text, target_lang, source_lang, style, topic)
+        if cached is None:
+            misses.append(text)
+        else:
+            translations[text] = cached
+
+    if misses:
+        # Repeated strings (template labels, footers) are translated once
+        # and scattered back to every occurrence
+        unique_misses = list(dict.fromkeys(misses))
+        translated_misses = _translate_texts(
+            unique_misses, structure_key, target_lang, source_lang, style, topic, config
+        )
+
+        pairs = [(text, result) for text, result in zip(unique_misses, translated_misses) if text]
+        if cache is not None:
+            cache.put_many(pairs, target_lang, source_lang, style, topic)
+        translations.update(pairs)
+
+    hit_count = sum(1 for text in flat_texts if text) - len(misses)
+    if hit_count:
+        print(f"✓ Reused {hit_count} cached translation(s)")
+
+    return {
+        structure_key: [
+            {"texts": [translations[text] for text in item["texts"]]}
+            for item in data[structure_key]
+        ]
+    }
+
+
+def _translate_texts(texts, structure_key, target_lang, source_lang, style, topic, config):
+    """Translate a flat list of texts, sharding large lists across requests.
+
+    One oversized prompt serializes the whole wait on a single HTTP round
+    trip and makes structure retries retranslate everything. Splitting into
+    chunks of [gemini] chunk_size texts and issuing them concurrently
+    ([gemini] concurrency workers) overlaps the request latency and shrinks
+    the blast radius of a mismatch retry to one chunk.
+
+    Args:
+        texts: List of texts to translate
+        structure_key: 'slides' or 'paragraphs', used for the payload shape
+        target_lang: Target language code
+        source_lang: Optional source language code
+        style: Translation style
+        topic: Translation topic
+        config: Config instance for the sharding knobs
+
+    Returns:
+        list: Translated texts, in input order
+    """
+
+    def translate_chunk(chunk):
+        payload = {structure_key: [{"texts": chunk}]}
+        translated = translate_with_gemini(
+            payload, target_lang, source_lang, retry_attempt=0, style=style, topic=topic
+        )
+        return translated[structure_key][0]["texts"]
+
+    chunk_size = max(1, config.get_gemini_chunk_size())
+    if len(texts) <= chunk_size:
+        return translate_chunk(texts)
+
+    chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    workers = min(max(1, config.get_gemini_concurrency()), len(chunks))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # executor.map preserves chunk order, so the flattened result
+        # lines up with the input texts
+        return [
+            text for chunk_result in executor.map(translate_chunk, chunks) for text in chunk_result
+        ]
+
+
+def translate_many(data_list, target_lang, source_lang=None, style=None, topic=None):
+    """Translate several extracted documents with one Gemini call per structure type.
+
+    The per-document item lists are concatenated into a single payload so a
+    directory of small files costs one API round trip instead of one per file,
+    then the translated items are sliced back out per document using the
+    recorded boundaries.
+
+    Args:
+        data_list: List of dictionaries with extracted texts
+        target_lang: Target language code
+        source_lang: Optional source language code
+        style: Optional translation style override
+        topic: Optional translation topic override
+
+    Returns:
+        list: Translated dictionaries, in the same order as data_list
+    """
+    results: list[Optional[dict]] = [None] * len(data_list)
+
+    # PPTX (slides) and DOCX (paragraphs) payloads are batched separately so
+    # each merged payload keeps a single structure key
+    for structure_key in ("slides", "paragraphs"):
+        indices = [i for i, data in enumerate(data_list) if structure_key in data]
+        if not indices:
+            continue
+
+        merged: dict[str, list] = {structure_key: []}
+        item_counts = []
+        for i in indices:
+            items = data_list[i][structure_key]
+            merged[structure_key].extend(items)
+            item_counts.append(len(items))
+
+        total_texts = sum(map(len, map(itemgetter("texts"), merged[structure_key])))
+        print(
+            f"Translating {total_texts} text elements "
+            f"from {len(indices)} document(s) to {target_lang}..."
+        )
+
+        translated = _translate_structure(
+            merged, target_lang, source_lang, style=style, topic=topic
+        )
+
+        # Demultiplex the merged response back into per-document dicts
+        position = 0
+        for i, count in zip(indices, item_counts):
+            results[i] = {structure_key: translated[structure_key][position : position + count]}
+            position += count
+
+    return results
+
+
+def translate(
+    input_json_path, output_json_path, target_lang, source_lang=None, style=None, topic=None
+):
+    """Main translation function.
+
+    Args:
+        input_json_path: Path to input JSON file
+        output_json_path: Path to output JSON file
+        target_lang: Target language code
+        source_lang: Optional source language code
+        style: Optional translation style override
+        topic: Optional translation topic override
+    """
+    print(f"Loading {input_json_path}...")
+    data = load_json(input_json_path)
+
+    translated_data = translate_data(data, target_lang, source_lang, style=style, topic=topic)
+
+    save_json(translated_data, output_json_path)
+
+    print("✓ Translation complete")
+    print(f"✓ Saved to {output_json_path}")
@@ -0,0 +1,114 @@
+"""Utility functions for the translator."""
+
+import contextlib
+import json
+import mmap
+import os
+from types import ModuleType
+from typing import Optional
+
+# Declared Optional so mypy narrows the is-not-None fast paths instead of
+# treating the stdlib fallbacks as unreachable when orjson is installed
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+
+def load_json_file(json_path):
+    """Load a JSON file, using orjson when available.
+
+    The orjson path parses the file through an mmap'd memoryview, so the
+    bytes are never copied into a Python object before parsing and peak
+    memory stays at roughly the parsed tree alone.
+
+    Args:
+        json_path: Path to JSON file
+
+    Returns:
+        dict: Loaded JSON data
+    """
+    if orjson is not None:
+        with open(json_path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+            except ValueError:  # empty file cannot be mapped
+                return orjson.loads(f.read())
+
+    with open(json_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dumps_json(data, pretty=False):
+    """Serialize data to a JSON string, using orjson when available.
+
+    Args:
+        data: Dictionary to serialize
+        pretty: Indent the output for human consumption
+
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+
+    return json.dumps(data, ensure_ascii=False, indent=2 if pretty else None)
+
+
+def save_json_file(data, json_path, pretty=False):
+    """Save data as JSON, using orjson when available.
+
+    Output is compact by default; indentation triggers the slow
+    pretty-printer path and inflates file size, so it is opt-in for files
+    meant to be read by humans.
+
+    The file is written to a .part scratch name and moved into place with
+    os.replace, so readers never observe a half-written JSON file.
+
+    Args:
+        data: Dictionary to save
+        json_path: Path to save JSON file
+        pretty: Indent the output for human consumption
+    """
+    part_path = f"{json_path}.part"
+    try:
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            with open(part_path, "wb") as f:
+                f.write(orjson.dumps(data, option=option))
+        else:
+            with open(part_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2 if pretty else None)
+        os.replace(part_path, json_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(part_path)
+        raise
+
+
+def validate_file(file_path, extension):
+    """Validate that a file exists and has the expected extension.
+
+    One os.stat both checks existence and yields the size, instead of the
+    separate exists-probe and extension check this replaces.
+
+    Args:
+        file_path: Path to file
+        extension: Expected extension (e.g., '.pptx')
+
+    Returns:
+        int: File size in bytes
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If extension doesn't match
+    """
+    if not file_path.endswith(extension):
+        raise ValueError(f"File must have {extension} extension: {file_path}")
+    try:
+        return os.stat(file_path).st_size
+    except OSError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e